@@ -37,20 +37,20 @@ def cmd_archive(args) -> int:
     try:
         logger.info(f"로그 압축 시작: {args.older_than_days}일 이상 된 파일")
 
-        compressed = archive_logs(older_than_days=args.older_than_days, archive_type=args.type)
+        compressed = archive_logs(older_than_days=args.older_than_days, archive_type=args.type,
+                                  compresslevel=args.compresslevel, archive_tier=args.tier)
 
         if not compressed:
             logger.info("압축할 파일이 없습니다.")
             return 0
 
         logger.info(f"압축 완료: {len(compressed)}개 파일")
-        for filename, size_bytes in compressed.items():
-            try:
-                size_mb = size_bytes / (1024 * 1024)
-                print(f"  - {filename}: {size_mb:.2f} MB")
-            except Exception as e:
-                logger.warning(f"파일 크기 계산 실패 ({filename}): {e}")
-                print(f"  - {filename}: 계산 오류")
+        # 줄 단위 print 대신 한 번에 기록 (파이프 출력 시 write 횟수 최소화)
+        lines = [
+            f"  - {filename}: {size_bytes / (1024 * 1024):.2f} MB"
+            for filename, size_bytes in compressed.items()
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         return 0
     except Exception as e:
@@ -110,20 +110,27 @@ def cmd_stats(args) -> int:
             logger.warning("통계 정보가 없습니다.")
             return 1
 
-        # 보기 좋게 출력
-        print("\n=== 로그 및 아카이브 통계 ===\n")
-
-        print("로그 파일:")
-        print(f"  - 파일 수: {stats.get('log_count', 0)}")
-        print(f"  - 총 크기: {stats.get('log_size_mb', 0):.2f} MB")
+        # 보기 좋게 출력 (한 번에 기록)
+        lines = [
+            "",
+            "=== 로그 및 아카이브 통계 ===",
+            "",
+            "로그 파일:",
+            f"  - 파일 수: {stats.get('log_count', 0)}",
+            f"  - 총 크기: {stats.get('log_size_mb', 0):.2f} MB",
+        ]
         if stats.get('oldest_log'):
-            print(f"  - 가장 오래된 파일: {stats['oldest_log']}")
+            lines.append(f"  - 가장 오래된 파일: {stats['oldest_log']}")
         if stats.get('newest_log'):
-            print(f"  - 가장 최신 파일: {stats['newest_log']}")
+            lines.append(f"  - 가장 최신 파일: {stats['newest_log']}")
 
-        print("\n아카이브 파일:")
-        print(f"  - 파일 수: {stats.get('archive_count', 0)}")
-        print(f"  - 총 크기: {stats.get('archive_size_mb', 0):.2f} MB")
+        lines.extend([
+            "",
+            "아카이브 파일:",
+            f"  - 파일 수: {stats.get('archive_count', 0)}",
+            f"  - 총 크기: {stats.get('archive_size_mb', 0):.2f} MB",
+        ])
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         return 0
     except Exception as e:
@@ -144,17 +151,15 @@ def cmd_list(args) -> int:
             print("아카이브 파일이 없습니다.")
             return 0
 
-        print(f"\n=== 아카이브 목록 ({len(archives)}개) ===\n")
-
+        # 수천 개 목록도 write 한 번으로 출력
+        lines = [f"\n=== 아카이브 목록 ({len(archives)}개) ===\n"]
         for archive in archives:
-            try:
-                print(f"파일명: {archive['name']}")
-                print(f"  - 크기: {archive['size_mb']:.2f} MB")
-                print(f"  - 생성일: {archive['created']}")
-                print(f"  - 경로: {archive['path']}")
-                print()
-            except Exception as e:
-                logger.warning(f"아카이브 정보 출력 실패: {e}")
+            lines.append(f"파일명: {archive['name']}")
+            lines.append(f"  - 크기: {archive['size_mb']:.2f} MB")
+            lines.append(f"  - 생성일: {archive['created']}")
+            lines.append(f"  - 경로: {archive['path']}")
+            lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         return 0
     except Exception as e:
@@ -264,9 +269,22 @@ def main():
     )
     archive_parser.add_argument(
         "--type",
-        choices=["zip", "gz"],
+        choices=["zip", "gz", "zst"],
         default="zip",
-        help="압축 형식 (기본값: zip)"
+        help="압축 형식 (기본값: zip, zst는 학습된 사전 기반 Zstandard 압축)"
+    )
+    archive_parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(1, 10),
+        default=6,
+        help="zlib 압축 레벨 (zip/gz 전용, 기본값: 6)"
+    )
+    archive_parser.add_argument(
+        "--tier",
+        choices=["realtime", "balanced", "archival"],
+        default="balanced",
+        help="zst 압축 티어 (기본값: balanced, 레벨 3/15/19에 대응)"
     )
     archive_parser.set_defaults(func=cmd_archive)
 
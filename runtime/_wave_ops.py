@@ -0,0 +1,69 @@
+"""
+파형 후처리 연산 모듈
+
+추론 결과 파형의 패딩 제거와 int16 양자화를 한 번의 패스로 처리합니다.
+numba가 설치되어 있으면 JIT 컴파일된 단일 C 루프를 사용하고,
+없으면 numpy 벡터 연산으로 대체합니다.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _trim_length(waveform: np.ndarray, sentinel: float) -> int:
+    """꼬리 패딩을 제외한 유효 길이 계산 (전부 패딩이면 전체 길이 유지)"""
+    if waveform.size == 0:
+        return 0
+
+    offset = int(np.argmax(waveform[::-1] != sentinel))
+    if offset == 0 and waveform[-1] == sentinel:
+        # 유효 샘플이 하나도 없으면 기존 동작대로 전체를 유지
+        return waveform.size
+
+    return waveform.size - offset
+
+
+def _quantize_numpy(waveform: np.ndarray, n: int) -> np.ndarray:
+    """numpy 대체 구현: 클리핑 + int16 변환"""
+    return np.clip(waveform[:n] * 32767.0, -32768, 32767).astype(np.int16)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _trim_and_quantize_jit(waveform, sentinel):  # pragma: no cover - JIT
+        # 꼬리에서부터 첫 유효 샘플 탐색
+        n = waveform.size
+        end = n
+        while end > 0 and waveform[end - 1] == sentinel:
+            end -= 1
+        if end == 0:
+            end = n  # 전부 패딩이면 전체 유지 (기존 동작)
+
+        out = np.empty(end, np.int16)
+        for i in range(end):
+            v = waveform[i] * 32767.0
+            if v < -32768.0:
+                out[i] = -32768
+            elif v > 32767.0:
+                out[i] = 32767
+            else:
+                out[i] = np.int16(v)
+        return out
+
+    def trim_and_quantize(waveform: np.ndarray, sentinel: float = -1.0) -> np.ndarray:
+        """패딩 제거 + int16 양자화를 단일 패스로 수행"""
+        if waveform.size == 0:
+            return np.empty(0, np.int16)
+        return _trim_and_quantize_jit(np.ascontiguousarray(waveform), sentinel)
+
+else:
+
+    def trim_and_quantize(waveform: np.ndarray, sentinel: float = -1.0) -> np.ndarray:
+        """패딩 제거 + int16 양자화 (numpy 대체 구현)"""
+        if waveform.size == 0:
+            return np.empty(0, np.int16)
+        return _quantize_numpy(waveform, _trim_length(waveform, sentinel))
@@ -3,10 +3,15 @@ FastAPI 기반 TTS REST API 서버
 
 Triton 서버를 백엔드로 사용하는 사용자 친화적인 REST API를 제공합니다.
 """
+import asyncio
 import base64
+import hashlib
 import io
+import secrets
+import struct
+import threading
 import time
-import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
@@ -18,8 +23,20 @@ from fastapi import FastAPI, File, Form, HTTPException, UploadFile, Request
 from fastapi.responses import Response, JSONResponse
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # SIMD (AVX2/SSSE3) 가속 base64 - 대용량 오디오 페이로드용
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
 from runtime.logging_config import setup_logging, get_logger
 from runtime.config_loader import load_config, get_api_config, get_logging_config
+from runtime._wave_ops import trim_and_quantize
 
 # 설정 로드
 config = load_config()
@@ -37,6 +54,136 @@ logger = get_logger(__name__)
 # Triton 클라이언트 전역 변수
 triton_client: Optional[httpclient.InferenceServerClient] = None
 
+# 요청마다 바뀌지 않는 Triton 상수는 모듈 로드 시 한 번만 준비
+# (InferRequestedOutput은 생성 후 변경되지 않으므로 요청 간 공유 가능)
+_MODEL_NAME = config.get('triton.model_name')
+_OUTPUT_PROTOS = [httpclient.InferRequestedOutput("waveform")]
+
+
+def _load_reference_audio(audio_bytes: bytes):
+    """
+    참조 오디오 바이트를 float32 버퍼로 디코딩
+
+    sf.read의 float64 중간 배열과 astype/reshape 복사를 피하기 위해
+    프레임 수만큼 미리 할당한 (1, frames) float32 버퍼로 직접 읽습니다.
+
+    Returns:
+        (audio_data, sample_rate) - audio_data는 (1, frames) float32 배열
+    """
+    with sf.SoundFile(io.BytesIO(audio_bytes)) as f:
+        audio_data = np.empty((1, f.frames), dtype=np.float32)
+        f.read(out=audio_data[0], dtype='float32')
+        return audio_data, f.samplerate
+
+
+# 같은 참조 오디오를 반복 전송하는 클라이언트를 위한 디코딩 캐시
+# (원본 바이트 대신 blake2b 다이제스트를 키로 사용)
+# 스레드 풀의 여러 워커가 동시에 접근하므로 조회/삽입/축출은 락으로 보호
+_REFERENCE_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_REFERENCE_CACHE_SIZE = 32
+_REFERENCE_CACHE_LOCK = threading.Lock()
+
+
+def _decode_reference(audio_bytes: bytes):
+    """참조 오디오 디코딩 (동일 바이트 재전송 시 캐시 히트)"""
+    digest = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+    with _REFERENCE_CACHE_LOCK:
+        cached = _REFERENCE_CACHE.get(digest)
+        if cached is not None:
+            _REFERENCE_CACHE.move_to_end(digest)
+            return cached
+
+    # 디코딩 자체는 락 밖에서 수행 (드물게 같은 입력이 중복 디코딩될 수 있음)
+    decoded = _load_reference_audio(audio_bytes)
+    with _REFERENCE_CACHE_LOCK:
+        _REFERENCE_CACHE[digest] = decoded
+        if len(_REFERENCE_CACHE) > _REFERENCE_CACHE_SIZE:
+            _REFERENCE_CACHE.popitem(last=False)
+    return decoded
+
+
+def _build_inputs(reference_text: str, text: str, audio_data: np.ndarray) -> list:
+    """두 TTS 핸들러가 공유하는 Triton 입력 목록 생성"""
+    num_samples = audio_data.shape[1]
+
+    wav_input = httpclient.InferInput("reference_wav", [1, num_samples], "FP32")
+    wav_input.set_data_from_numpy(audio_data, binary_data=True)
+    wav_len_input = httpclient.InferInput("reference_wav_len", [1, 1], "INT32")
+    wav_len_input.set_data_from_numpy(np.array([[num_samples]], dtype=np.int32), binary_data=True)
+
+    return [
+        _bytes_input("reference_text", reference_text),
+        _bytes_input("target_text", text),
+        wav_input,
+        wav_len_input,
+    ]
+
+
+def _encode_wav(samples_i16: np.ndarray, sample_rate: int = 24000) -> bytes:
+    """
+    int16 PCM 샘플을 WAV 바이트로 인코딩
+
+    출력은 항상 모노 PCM이므로 libsndfile을 거치지 않고 44바이트
+    RIFF 헤더를 직접 만들어 샘플 버퍼를 붙입니다.
+    """
+    data = samples_i16.tobytes()
+    header = (
+        b'RIFF' + struct.pack('<I', 36 + len(data)) + b'WAVEfmt '
+        + struct.pack('<IHHIIHH', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+        + b'data' + struct.pack('<I', len(data))
+    )
+    return header + data
+
+
+def _encode_wav_b64(samples_i16: np.ndarray, sample_rate: int = 24000) -> str:
+    """WAV 인코딩 후 base64 문자열 반환 (스레드 풀 오프로드용)"""
+    return _b64.b64encode(_encode_wav(samples_i16, sample_rate)).decode('utf-8')
+
+
+def _bytes_input(name: str, value: str) -> httpclient.InferInput:
+    """
+    UTF-8로 미리 인코딩된 BYTES 입력 생성
+
+    binary_data=True로 전송해 tritonclient의 JSON 인코딩 경로와
+    원소별 타입 검사 루프를 피합니다.
+    """
+    infer_input = httpclient.InferInput(name, [1], "BYTES")
+    infer_input.set_data_from_numpy(
+        np.asarray([value.encode("utf-8")], dtype=object), binary_data=True
+    )
+    return infer_input
+
+
+async def _run_triton_tts(
+    text: str, reference_text: str, audio_data: np.ndarray, request_id: str
+) -> np.ndarray:
+    """
+    두 TTS 핸들러가 공유하는 Triton 추론 경로
+
+    async_infer로 요청을 제출하고 결과 대기는 스레드 풀에서 수행해
+    이벤트 루프를 막지 않습니다. 동시 요청들이 서로를 기다리지 않고
+    Triton의 dynamic batcher 큐에 쌓일 수 있어 서버 측 배칭이 동작합니다.
+
+    Returns:
+        패딩이 포함된 원시 파형 (float 1차원 배열)
+    """
+    inputs = _build_inputs(reference_text, text, audio_data)
+
+    logger.debug("Triton 추론 시작", extra={"request_id": request_id})
+    start_inference = time.time()
+
+    async_request = triton_client.async_infer(_MODEL_NAME, inputs, outputs=_OUTPUT_PROTOS)
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(None, async_request.get_result)
+
+    inference_time = (time.time() - start_inference) * 1000
+    logger.info(
+        "Triton 추론 완료: %.2fms", inference_time,
+        extra={"request_id": request_id, "duration_ms": inference_time}
+    )
+
+    return response.as_numpy("waveform").squeeze()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -47,14 +194,21 @@ async def lifespan(app: FastAPI):
     logger.info("FastAPI 서버 시작 중...")
     try:
         triton_url = api_config['triton_url']
-        triton_client = httpclient.InferenceServerClient(url=triton_url)
-        model_name = config.get('triton.model_name')
-        if triton_client.is_server_live() and triton_client.is_model_ready(model_name):
+        # keep-alive 연결을 재사용하고 버스트 시 head-of-line 블로킹을 피하기 위해
+        # 커넥션 풀 크기를 워커 수에 맞춰 늘린다
+        triton_client = httpclient.InferenceServerClient(
+            url=triton_url,
+            concurrency=max(16, (api_config['workers'] or 1) * 4),
+            connection_timeout=api_config['triton_timeout'],
+            network_timeout=api_config['triton_timeout'],
+            verbose=False,
+        )
+        if triton_client.is_server_live() and triton_client.is_model_ready(_MODEL_NAME):
             logger.info("Triton 서버 연결 성공")
         else:
             logger.error("Triton 서버 또는 모델이 준비되지 않음")
     except Exception as e:
-        logger.error(f"Triton 서버 연결 실패: {e}")
+        logger.error("Triton 서버 연결 실패: %s", e)
         triton_client = None
     
     yield
@@ -63,11 +217,24 @@ async def lifespan(app: FastAPI):
     logger.info("FastAPI 서버 종료")
 
 
+if orjson is not None:
+    class ORJSONResponse(JSONResponse):
+        """orjson 기반 JSON 응답 (대용량 base64 페이로드 직렬화 가속)"""
+        media_type = "application/json"
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
+else:
+    # orjson 미설치 시 기본 직렬화 사용
+    ORJSONResponse = JSONResponse
+
+
 app = FastAPI(
     title="ZipVoice TTS API",
     description="Text-to-Speech API using ZipVoice model",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -88,12 +255,13 @@ class HealthResponse(BaseModel):
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """모든 요청/응답 로깅 미들웨어"""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
+    request.state.request_id = request_id
     start_time = time.time()
     
     # 요청 로깅
     logger.info(
-        f"요청 시작: {request.method} {request.url.path}",
+        "요청 시작: %s %s", request.method, request.url.path,
         extra={"request_id": request_id}
     )
     
@@ -104,7 +272,7 @@ async def log_requests(request: Request, call_next):
         
         # 응답 로깅
         logger.info(
-            f"요청 완료: {request.method} {request.url.path} - {response.status_code}",
+            "요청 완료: %s %s - %s", request.method, request.url.path, response.status_code,
             extra={
                 "request_id": request_id,
                 "duration_ms": round(duration_ms, 2),
@@ -119,7 +287,7 @@ async def log_requests(request: Request, call_next):
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
         logger.error(
-            f"요청 실패: {request.method} {request.url.path} - {str(e)}",
+            "요청 실패: %s %s - %s", request.method, request.url.path, e,
             extra={
                 "request_id": request_id,
                 "duration_ms": round(duration_ms, 2)
@@ -138,9 +306,9 @@ async def health_check():
     if triton_client:
         try:
             triton_connected = triton_client.is_server_live()
-            model_ready = triton_client.is_model_ready(config.get('triton.model_name'))
+            model_ready = triton_client.is_model_ready(_MODEL_NAME)
         except Exception as e:
-            logger.warning(f"헬스 체크 실패: {e}")
+            logger.warning("헬스 체크 실패: %s", e)
     
     status = "healthy" if (triton_connected and model_ready) else "unhealthy"
     
@@ -153,6 +321,7 @@ async def health_check():
 
 @app.post("/tts")
 async def text_to_speech(
+    request: Request,
     text: str = Form(..., description="생성할 텍스트"),
     reference_text: str = Form(..., description="참조 오디오의 텍스트"),
     reference_audio: UploadFile = File(..., description="참조 오디오 파일 (WAV)")
@@ -168,71 +337,42 @@ async def text_to_speech(
     Returns:
         생성된 오디오 파일 (WAV)
     """
-    request_id = str(uuid.uuid4())[:8]
-    logger.info(f"TTS 요청: text='{text[:50]}...', ref_text='{reference_text[:50]}...'", extra={"request_id": request_id})
+    # 미들웨어에서 발급한 요청 ID 재사용
+    request_id = getattr(request.state, "request_id", None) or secrets.token_hex(4)
+    logger.info("TTS 요청: text='%.50s...', ref_text='%.50s...'", text, reference_text, extra={"request_id": request_id})
     
     if not triton_client:
         logger.error("Triton 클라이언트가 초기화되지 않음", extra={"request_id": request_id})
         raise HTTPException(status_code=503, detail="Triton 서버에 연결할 수 없습니다")
     
     try:
-        # 참조 오디오 로드
+        # 참조 오디오 로드 (디코딩은 이벤트 루프를 막지 않도록 스레드 풀에서)
         audio_bytes = await reference_audio.read()
-        audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes))
-        
-        logger.info(
-            f"참조 오디오 로드 완료: {len(audio_data)} samples, {sample_rate}Hz",
+        loop = asyncio.get_running_loop()
+        audio_data, sample_rate = await loop.run_in_executor(None, _decode_reference, audio_bytes)
+        num_samples = audio_data.shape[1]
+
+        logger.debug(
+            "참조 오디오 로드 완료: %s samples, %sHz", num_samples, sample_rate,
             extra={"request_id": request_id}
         )
-        
-        # Triton 입력 준비
-        inputs = []
-        inputs.append(httpclient.InferInput("reference_text", [1], "BYTES"))
-        inputs.append(httpclient.InferInput("target_text", [1], "BYTES"))
-        inputs.append(httpclient.InferInput("reference_wav", [1, len(audio_data)], "FP32"))
-        inputs.append(httpclient.InferInput("reference_wav_len", [1, 1], "INT32"))
-        
-        inputs[0].set_data_from_numpy(np.array([reference_text.encode("utf-8")], dtype=np.object_))
-        inputs[1].set_data_from_numpy(np.array([text.encode("utf-8")], dtype=np.object_))
-        inputs[2].set_data_from_numpy(audio_data.astype(np.float32).reshape(1, -1))
-        inputs[3].set_data_from_numpy(np.array([[len(audio_data)]], dtype=np.int32))
-        
-        # 출력 설정
-        outputs = []
-        outputs.append(httpclient.InferRequestedOutput("waveform"))
-        
-        # Triton 추론
-        logger.info("Triton 추론 시작", extra={"request_id": request_id})
-        start_inference = time.time()
-        
-        response = triton_client.infer(config.get('triton.model_name'), inputs, outputs=outputs)
-        
-        inference_time = (time.time() - start_inference) * 1000
-        logger.info(
-            f"Triton 추론 완료: {inference_time:.2f}ms",
-            extra={"request_id": request_id, "duration_ms": inference_time}
-        )
-        
-        # 결과 추출
-        waveform = response.as_numpy("waveform").squeeze()
-        
-        # 패딩 제거 (-1.0은 패딩값)
-        valid_idx = np.where(waveform != -1.0)[0]
-        if len(valid_idx) > 0:
-            waveform = waveform[:valid_idx[-1] + 1]
-        
-        logger.info(
-            f"오디오 생성 완료: {len(waveform)} samples",
+
+        # Triton 추론 (공유 경로)
+        waveform = await _run_triton_tts(text, reference_text, audio_data, request_id)
+
+        # 패딩 제거 + int16 변환 (단일 패스)
+        samples_i16 = trim_and_quantize(waveform)
+
+        logger.debug(
+            "오디오 생성 완료: %s samples", samples_i16.size,
             extra={"request_id": request_id}
         )
-        
-        # WAV 파일로 변환
-        output_buffer = io.BytesIO()
-        sf.write(output_buffer, waveform, 24000, format='WAV')
-        output_buffer.seek(0)
-        
+
+        # WAV 파일로 변환 (인코딩도 스레드 풀로 오프로드)
+        wav_bytes = await loop.run_in_executor(None, _encode_wav, samples_i16)
+
         return Response(
-            content=output_buffer.read(),
+            content=wav_bytes,
             media_type="audio/wav",
             headers={
                 "Content-Disposition": f"attachment; filename=generated_{request_id}.wav",
@@ -241,23 +381,25 @@ async def text_to_speech(
         )
         
     except Exception as e:
-        logger.error(f"TTS 생성 실패: {e}", extra={"request_id": request_id}, exc_info=True)
+        logger.error("TTS 생성 실패: %s", e, extra={"request_id": request_id}, exc_info=True)
         raise HTTPException(status_code=500, detail=f"TTS 생성 중 오류 발생: {str(e)}")
 
 
 @app.post("/tts/json")
-async def text_to_speech_json(request: TTSRequest):
+async def text_to_speech_json(request: TTSRequest, http_request: Request):
     """
     JSON 기반 TTS 생성 (base64 인코딩된 오디오 사용)
-    
+
     Args:
         request: TTS 요청 (JSON)
-    
+        http_request: FastAPI 요청 객체 (요청 ID 전달용)
+
     Returns:
         생성된 오디오 (base64 인코딩)
     """
-    request_id = str(uuid.uuid4())[:8]
-    logger.info(f"TTS JSON 요청: text='{request.text[:50]}...'", extra={"request_id": request_id})
+    # 미들웨어에서 발급한 요청 ID 재사용
+    request_id = getattr(http_request.state, "request_id", None) or secrets.token_hex(4)
+    logger.info("TTS JSON 요청: text='%.50s...'", request.text, extra={"request_id": request_id})
     
     if not triton_client:
         raise HTTPException(status_code=503, detail="Triton 서버에 연결할 수 없습니다")
@@ -265,54 +407,37 @@ async def text_to_speech_json(request: TTSRequest):
     try:
         # Base64 디코딩
         if request.reference_audio_base64:
-            audio_bytes = base64.b64decode(request.reference_audio_base64)
+            audio_bytes = _b64.b64decode(request.reference_audio_base64, validate=False)
         else:
             raise HTTPException(status_code=400, detail="reference_audio_base64가 필요합니다")
         
-        # 오디오 로드
-        audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes))
-        
-        # Triton 추론 (위와 동일한 로직)
-        inputs = []
-        inputs.append(httpclient.InferInput("reference_text", [1], "BYTES"))
-        inputs.append(httpclient.InferInput("target_text", [1], "BYTES"))
-        inputs.append(httpclient.InferInput("reference_wav", [1, len(audio_data)], "FP32"))
-        inputs.append(httpclient.InferInput("reference_wav_len", [1, 1], "INT32"))
-        
-        inputs[0].set_data_from_numpy(np.array([request.reference_text.encode("utf-8")], dtype=np.object_))
-        inputs[1].set_data_from_numpy(np.array([request.text.encode("utf-8")], dtype=np.object_))
-        inputs[2].set_data_from_numpy(audio_data.astype(np.float32).reshape(1, -1))
-        inputs[3].set_data_from_numpy(np.array([[len(audio_data)]], dtype=np.int32))
-        
-        outputs = [httpclient.InferRequestedOutput("waveform")]
-        
-        response = triton_client.infer("zipvoice_dialog", inputs, outputs=outputs)
-        waveform = response.as_numpy("waveform").squeeze()
-        
-        # 패딩 제거
-        valid_idx = np.where(waveform != -1.0)[0]
-        if len(valid_idx) > 0:
-            waveform = waveform[:valid_idx[-1] + 1]
-        
-        # WAV로 변환 후 base64 인코딩
-        output_buffer = io.BytesIO()
-        sf.write(output_buffer, waveform, 24000, format='WAV')
-        output_buffer.seek(0)
-        audio_base64 = base64.b64encode(output_buffer.read()).decode('utf-8')
+        # 오디오 로드 (디코딩은 이벤트 루프를 막지 않도록 스레드 풀에서)
+        loop = asyncio.get_running_loop()
+        audio_data, sample_rate = await loop.run_in_executor(None, _decode_reference, audio_bytes)
+        num_samples = audio_data.shape[1]
+
+        # Triton 추론 (공유 경로)
+        waveform = await _run_triton_tts(request.text, request.reference_text, audio_data, request_id)
+
+        # 패딩 제거 + int16 변환 (단일 패스)
+        samples_i16 = trim_and_quantize(waveform)
+
+        # WAV로 변환 후 base64 인코딩 (스레드 풀로 오프로드)
+        audio_base64 = await loop.run_in_executor(None, _encode_wav_b64, samples_i16)
         
         logger.info("TTS JSON 생성 완료", extra={"request_id": request_id})
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "audio_base64": audio_base64,
             "sample_rate": 24000,
-            "duration_seconds": len(waveform) / 24000,
+            "duration_seconds": samples_i16.size / 24000,
             "request_id": request_id
         })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"TTS JSON 생성 실패: {e}", extra={"request_id": request_id}, exc_info=True)
+        logger.error("TTS JSON 생성 실패: %s", e, extra={"request_id": request_id}, exc_info=True)
         raise HTTPException(status_code=500, detail=f"TTS 생성 중 오류 발생: {str(e)}")
 
 
@@ -4,6 +4,7 @@
 YAML 설정 파일을 읽고 환경 변수로 오버라이드를 지원합니다.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -12,26 +13,31 @@ import yaml
 
 class Config:
     """설정 클래스"""
-    
+
     def __init__(self, config_dict: Dict[str, Any]):
         self._config = config_dict
-    
+        # 점 표기법 키를 한 번만 펼쳐 두고 get()은 O(1) 조회만 수행
+        self._flat: Dict[str, Any] = {}
+        self._flatten(config_dict, "")
+
+    def _flatten(self, d: Dict[str, Any], prefix: str) -> None:
+        """중첩 딕셔너리를 'a.b.c' 형태의 평탄 딕셔너리로 변환"""
+        for k, v in d.items():
+            path = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict):
+                # 중간 노드도 조회 가능하도록 함께 저장
+                self._flat[path] = v
+                self._flatten(v, path)
+            else:
+                self._flat[path] = v
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         점 표기법으로 설정 값 가져오기
         예: config.get('api.port') -> 8080
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
-    
+        return self._flat.get(key, default)
+
     def __getitem__(self, key: str) -> Any:
         """딕셔너리 스타일 접근"""
         return self._config[key]
@@ -41,15 +47,17 @@ class Config:
         return key in self._config
 
 
+@lru_cache(maxsize=4)
 def load_config(config_path: Optional[str] = None) -> Config:
     """
-    설정 파일 로드
-    
+    설정 파일 로드 (경로별로 캐시됨)
+
     Args:
         config_path: 설정 파일 경로 (기본값: config/server_config.yaml)
-    
+
     Returns:
-        Config 객체
+        Config 객체 (같은 경로로 재호출 시 캐시된 객체 반환,
+        강제로 다시 읽으려면 load_config.cache_clear() 호출)
     """
     if config_path is None:
         # 기본 설정 파일 경로
@@ -80,32 +88,44 @@ def _override_with_env(config: Dict[str, Any], prefix: str = "ZIPVOICE") -> Dict
     Args:
         config: 설정 딕셔너리
         prefix: 환경 변수 접두사
-    
+
     Returns:
         오버라이드된 설정 딕셔너리
     """
-    for section, values in config.items():
-        if not isinstance(values, dict):
+    # 설정 키마다 getenv를 호출하는 대신 환경 변수를 한 번만 훑는다.
+    # 환경 변수 개수는 설정 키 개수보다 대체로 훨씬 적다.
+    env_prefix = f"{prefix}_"
+
+    for env_key, env_value in os.environ.items():
+        if not env_key.startswith(env_prefix):
             continue
-        
-        for key, value in values.items():
-            env_key = f"{prefix}_{section}_{key}".upper()
-            env_value = os.getenv(env_key)
-            
-            if env_value is not None:
-                # 타입 변환
-                if isinstance(value, bool):
-                    config[section][key] = env_value.lower() in ('true', '1', 'yes')
-                elif isinstance(value, int):
-                    config[section][key] = int(env_value)
-                elif isinstance(value, float):
-                    config[section][key] = float(env_value)
-                else:
-                    config[section][key] = env_value
-    
+
+        # ZIPVOICE_API_PORT -> section='api', key='port'
+        # (키에 밑줄이 있는 경우도 section 뒤 나머지 전체가 키)
+        parts = env_key[len(env_prefix):].lower().split('_', 1)
+        if len(parts) != 2:
+            continue
+        section, key = parts
+
+        values = config.get(section)
+        if not isinstance(values, dict) or key not in values:
+            continue
+
+        # 타입 변환 (기존 값의 타입 기준)
+        value = values[key]
+        if isinstance(value, bool):
+            values[key] = env_value.lower() in ('true', '1', 'yes')
+        elif isinstance(value, int):
+            values[key] = int(env_value)
+        elif isinstance(value, float):
+            values[key] = float(env_value)
+        else:
+            values[key] = env_value
+
     return config
 
 
+@lru_cache(maxsize=4)
 def get_inference_config(config: Config) -> Dict[str, Any]:
     """추론 설정 추출"""
     return {
@@ -122,6 +142,7 @@ def get_inference_config(config: Config) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4)
 def get_triton_config(config: Config) -> Dict[str, Any]:
     """Triton 설정 추출"""
     return {
@@ -136,6 +157,7 @@ def get_triton_config(config: Config) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4)
 def get_api_config(config: Config) -> Dict[str, Any]:
     """API 설정 추출"""
     return {
@@ -148,6 +170,7 @@ def get_api_config(config: Config) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4)
 def get_logging_config(config: Config) -> Dict[str, Any]:
     """로깅 설정 추출"""
     return {
@@ -3,14 +3,45 @@
 
 로그 파일을 자동으로 압축, 정렬, 아카이브하는 기능을 제공합니다.
 """
+import asyncio
+import hashlib
 import logging
 import shutil
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property, partial
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import gzip
+import mmap
 import os
+import time
+import zlib
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# 이 개수 이상의 파일을 지울 때는 배치 삭제 사용
+_UNLINK_BATCH_THRESHOLD = 32
+
+# 통계/목록 조회 결과 캐시 유지 시간 (초) — 대시보드 폴링 대응
+_QUERY_CACHE_TTL_S = 5.0
+
+# Zstd 티어별 압축 레벨 (실시간: 처리량 우선 / 균형 / 보관: 압축률 우선)
+_ZSTD_TIER_LEVELS = {
+    "realtime": 3,
+    "balanced": 15,
+    "archival": 19,
+}
+
+# 사전 학습에 사용할 샘플 설정
+_DICT_SIZE = 100_000           # 학습할 사전 크기 (바이트)
+_DICT_SAMPLE_BYTES = 128 * 1024  # 파일당 샘플링할 최대 바이트
+_DICT_MAX_AGE_DAYS = 30        # 사전 재학습 주기
+_DICT_SUFFIX = ".zdict"        # 압축 사전 파일 접미사 (버전별로 여러 개 존재)
 
 
 class LogArchiver:
@@ -27,58 +58,197 @@ class LogArchiver:
         self.log_path = Path(log_dir)
         self.archive_path = Path(archive_dir or f"{log_dir}/archive")
         self.archive_path.mkdir(parents=True, exist_ok=True)
+        # 디렉토리는 여기서 만들어지고 이후 사실상 삭제되지 않으므로
+        # 메서드마다 exists()로 stat을 반복하지 않도록 한 번만 확인해 둠
+        self._archive_dir_ok = self.archive_path.is_dir()
         self.logger = logging.getLogger(__name__)
+        self._zstd_dict = None
+        self._zstd_dict_loaded = False
+        # 파일마다 압축기를 새로 만들지 않도록 (사전 로드 + 초기화 비용) 재사용
+        self._zstd_cctx = None
+        self._zstd_cctx_level = None
+        # 조회 결과 캐시: (버전, monotonic 시각, 결과). 변경 작업이 버전을
+        # 올리면 자동 무효화되고, 그 외에는 짧은 TTL 동안 재사용됩니다.
+        self._version = 0
+        self._stats_cache: Optional[Tuple[int, float, Dict[str, object]]] = None
+        self._list_cache: Optional[Tuple[int, float, List[Dict[str, object]]]] = None
+
+    @cached_property
+    def _log_dir_ok(self) -> bool:
+        """로그 디렉토리 존재 여부 (최초 접근 시 한 번만 확인)"""
+        return self.log_path.is_dir()
+
+    def _scan(self, path: Path, suffix: Optional[str] = None):
+        """
+        디렉토리 한 패스 스캔
+
+        os.scandir의 DirEntry를 이용해 entry당 stat을 한 번만 호출하고,
+        호출부가 크기/수정시각을 재-stat 없이 재사용할 수 있도록
+        (DirEntry, stat_result) 튜플을 생성합니다.
 
-    def compress_logs(self, older_than_days: int = 7, archive_type: str = "zip") -> Dict[str, int]:
+        Args:
+            path: 스캔할 디렉토리
+            suffix: 파일명 접미사 필터 (예: '.log', None이면 모든 파일)
+        """
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if suffix is not None and not entry.name.endswith(suffix):
+                        continue
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError as e:
+                        self.logger.warning(f"파일 stat 실패 ({entry.name}): {e}")
+                        continue
+                    yield entry, st
+        except OSError as e:
+            self.logger.error(f"디렉토리 스캔 실패 ({path}): {e}")
+
+    def compress_logs(self, older_than_days: int = 7, archive_type: str = "zip",
+                      compresslevel: int = 6, archive_tier: str = "balanced") -> Dict[str, int]:
         """
         지정된 날짜보다 오래된 로그 파일을 압축
 
         Args:
             older_than_days: 이 날짜보다 오래된 파일을 압축 (기본값: 7일)
-            archive_type: 압축 형식 ('zip' 또는 'gz', 기본값: 'zip')
+            archive_type: 압축 형식 ('zip', 'gz' 또는 'zst', 기본값: 'zip')
+            compresslevel: zlib 압축 레벨 1~9 (zip/gz에만 적용, 기본값: 6 —
+                레벨 9 대비 CPU를 크게 아끼면서 압축률 손실은 수 % 이내)
+            archive_tier: zst 전용 티어 선택 ('realtime'/'balanced'/'archival'
+                -> 레벨 3/15/19, 기본값: 'balanced')
 
         Returns:
             압축 결과 딕셔너리 {file_name: size_bytes}
         """
-        cutoff_date = datetime.now() - timedelta(days=older_than_days)
+        zstd_level = _ZSTD_TIER_LEVELS.get(archive_tier, _ZSTD_TIER_LEVELS["balanced"])
+        self._version += 1  # 파일이 변하므로 조회 캐시 무효화
+        # float datetime 대신 정수 ns 비교 (루프 내 변환/반올림 없음)
+        cutoff_ns = time.time_ns() - older_than_days * 86_400 * 1_000_000_000
         compressed_files = {}
 
-        if not self.log_path.exists():
+        if not self._log_dir_ok:
             self.logger.warning(f"로그 디렉토리가 없습니다: {self.log_path}")
             return compressed_files
 
-        # 압축 대상 파일 찾기
+        # 압축 대상 파일 찾기 (스캔에서 얻은 stat을 그대로 재사용,
+        # entry별 오류는 _scan이 처리하므로 추가 예외 프레임 불필요)
+        candidates = [
+            Path(entry.path)
+            for entry, st in self._scan(self.log_path, ".log")
+            if st.st_mtime_ns < cutoff_ns
+        ]
+
+        if not candidates:
+            return compressed_files
+
+        # 압축은 CPU 바운드이므로 파일이 여러 개면 프로세스 풀로 분산
+        if len(candidates) > 1:
+            try:
+                return self._compress_parallel(candidates, archive_type, compresslevel, zstd_level)
+            except Exception as e:
+                self.logger.warning(f"병렬 압축 실패, 순차 압축으로 대체: {e}")
+
+        for log_file in candidates:
+            result = self._compress_single(log_file, archive_type, compresslevel, zstd_level)
+            if result:
+                name, size = result
+                compressed_files[name] = size
+
+        return compressed_files
+
+    async def compress_logs_async(self, older_than_days: int = 7, archive_type: str = "zip",
+                                  compresslevel: int = 6,
+                                  archive_tier: str = "balanced") -> Dict[str, int]:
+        """
+        compress_logs의 비동기 래퍼
+
+        이벤트 루프(예: FastAPI 수명주기 훅)에서 유지보수를 돌릴 때
+        스캔/압축의 블로킹 I/O가 루프를 멈추지 않도록 기본 실행기에 위임합니다.
+        파일 간 병렬화는 내부 프로세스 풀이 이미 담당합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.compress_logs, older_than_days=older_than_days,
+                    archive_type=archive_type, compresslevel=compresslevel,
+                    archive_tier=archive_tier),
+        )
+
+    def _compress_single(self, log_file: Path, archive_type: str,
+                         compresslevel: int = 6, zstd_level: int = 15) -> Optional[Tuple[str, int]]:
+        """파일 하나를 압축하고 성공 시 원본을 삭제"""
+        if archive_type == "gz":
+            compressed_path = self._compress_gzip(log_file, compresslevel=compresslevel)
+        elif archive_type == "zst":
+            compressed_path = self._compress_zstd(log_file, level=zstd_level)
+        else:
+            compressed_path = self._compress_zip(log_file, compresslevel=compresslevel)
+
+        if not compressed_path:
+            return None
+
         try:
-            for log_file in self.log_path.glob("*.log"):
+            size = compressed_path.stat().st_size
+        except OSError as e:
+            self.logger.error(f"압축 파일 크기 확인 실패 ({compressed_path.name}): {e}")
+            return None
+
+        # 원본 파일 삭제
+        try:
+            log_file.unlink()
+            self.logger.info(f"압축 및 삭제 완료: {log_file.name}")
+        except OSError as e:
+            self.logger.error(f"파일 삭제 실패 ({log_file.name}): {e}")
+
+        return compressed_path.name, size
+
+    def _compress_parallel(self, candidates: List[Path], archive_type: str,
+                           compresslevel: int = 6, zstd_level: int = 15) -> Dict[str, int]:
+        """압축 작업을 프로세스 풀에 분산"""
+        compressed_files = {}
+
+        # 사전은 부모에서 한 번 준비해 워커에 바이트로 전달
+        dict_bytes = None
+        if archive_type == "zst" and zstd is not None:
+            if not self._zstd_dict_loaded:
+                self._zstd_dict = self._get_or_train_dict()
+                self._zstd_dict_loaded = True
+            if self._zstd_dict is not None:
+                dict_bytes = self._zstd_dict.as_bytes()
+
+        tasks = [
+            (str(log_file), str(self.log_path), str(self.archive_path), archive_type,
+             dict_bytes, compresslevel, zstd_level)
+            for log_file in candidates
+        ]
+
+        # 워커 수를 제한해 큰 디렉토리에서도 풀 생성/메모리 비용을 일정하게 유지
+        max_workers = min(os.cpu_count() or 1, 8)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for log_file, result in zip(candidates, executor.map(_compress_one, tasks, chunksize=8)):
+                if result is None:
+                    continue
+                name, size = result
+                compressed_files[name] = size
+                # 원본 파일 삭제
                 try:
-                    if log_file.stat().st_mtime < cutoff_date.timestamp():
-                        if archive_type == "gz":
-                            compressed_path = self._compress_gzip(log_file)
-                        else:
-                            compressed_path = self._compress_zip(log_file)
-
-                        if compressed_path:
-                            compressed_files[compressed_path.name] = compressed_path.stat().st_size
-                            # 원본 파일 삭제
-                            try:
-                                log_file.unlink()
-                                self.logger.info(f"압축 및 삭제 완료: {log_file.name}")
-                            except Exception as e:
-                                self.logger.error(f"파일 삭제 실패 ({log_file.name}): {e}")
+                    log_file.unlink()
+                    self.logger.info(f"압축 및 삭제 완료: {log_file.name}")
                 except OSError as e:
-                    self.logger.error(f"파일 상태 확인 실패 ({log_file}): {e}")
-        except Exception as e:
-            self.logger.error(f"로그 압축 중 오류: {e}")
+                    self.logger.error(f"파일 삭제 실패 ({log_file.name}): {e}")
 
         return compressed_files
 
-    def _compress_gzip(self, log_file: Path) -> Optional[Path]:
-        """Gzip 압축"""
+    def _compress_gzip(self, log_file: Path, compresslevel: int = 6) -> Optional[Path]:
+        """Gzip 압축 (기본 레벨 6: gzip 기본값 9보다 CPU 효율이 훨씬 좋음)"""
         try:
             archive_file = self.archive_path / f"{log_file.name}.gz"
             with open(log_file, 'rb') as f_in:
-                with gzip.open(archive_file, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                with gzip.open(archive_file, 'wb', compresslevel=compresslevel) as f_out:
+                    # 기본 64KiB 청크 대신 1MiB로 파이썬 왕복/syscall 횟수 축소
+                    shutil.copyfileobj(f_in, f_out, length=1 << 20)
             self.logger.info(f"Gzip 압축 완료: {log_file.name} -> {archive_file.name}")
             return archive_file
         except IOError as e:
@@ -88,11 +258,12 @@ class LogArchiver:
             self.logger.error(f"Gzip 압축 실패 ({log_file}): {e}")
             return None
 
-    def _compress_zip(self, log_file: Path) -> Optional[Path]:
+    def _compress_zip(self, log_file: Path, compresslevel: int = 6) -> Optional[Path]:
         """Zip 압축"""
         try:
             archive_file = self.archive_path / f"{log_file.name}.zip"
-            with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+            with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=compresslevel) as zf:
                 zf.write(log_file, arcname=log_file.name)
             self.logger.info(f"ZIP 압축 완료: {log_file.name} -> {archive_file.name}")
             return archive_file
@@ -106,12 +277,126 @@ class LogArchiver:
             self.logger.error(f"ZIP 압축 실패 ({log_file}): {e}")
             return None
 
-    def create_daily_archive(self, date_str: Optional[str] = None) -> Optional[Path]:
+    def _get_or_train_dict(self) -> Optional["zstd.ZstdCompressionDict"]:
+        """
+        Zstd 압축 사전 로드 또는 학습
+
+        로그 텍스트는 반복성이 높아 학습된 사전을 쓰면 압축률이 크게 개선됩니다.
+        사전으로 만든 .zst 프레임은 그 사전이 있어야만 복원할 수 있으므로,
+        재학습 시 기존 파일을 덮어쓰지 않고 내용 해시를 붙인 새 파일로
+        저장합니다 (logs-<해시>.zdict). 이전 버전 사전은 그대로 보존되어
+        보관 중인 .zst 아카이브를 항상 복원할 수 있습니다.
+
+        Returns:
+            ZstdCompressionDict 인스턴스 (학습 불가 시 None)
+        """
+        if zstd is None:
+            return None
+
+        # 가장 최근 사전 파일 탐색 (구버전 logs.zdict도 접미사로 걸림)
+        latest_path = None
+        latest_mtime = 0.0
+        for entry, st in self._scan(self.archive_path, _DICT_SUFFIX):
+            if st.st_mtime > latest_mtime:
+                latest_path, latest_mtime = entry.path, st.st_mtime
+
+        # 최신 사전이 충분히 새것이면 재사용
+        try:
+            if latest_path is not None:
+                dict_age = datetime.now().timestamp() - latest_mtime
+                if dict_age < _DICT_MAX_AGE_DAYS * 86400:
+                    return zstd.ZstdCompressionDict(Path(latest_path).read_bytes())
+        except (OSError, zstd.ZstdError) as e:
+            self.logger.warning(f"압축 사전 로드 실패, 재학습합니다: {e}")
+
+        # 최근 로그에서 샘플을 모아 사전 학습
+        samples = []
+        try:
+            for entry, _st in self._scan(self.log_path, ".log"):
+                try:
+                    with open(entry.path, 'rb') as f:
+                        sample = f.read(_DICT_SAMPLE_BYTES)
+                    if sample:
+                        samples.append(sample)
+                except OSError as e:
+                    self.logger.warning(f"사전 샘플 수집 실패 ({entry.name}): {e}")
+        except Exception as e:
+            self.logger.warning(f"사전 샘플 스캔 실패: {e}")
+
+        if len(samples) < 2:
+            # 샘플이 부족하면 사전 없이 압축
+            return None
+
+        try:
+            trained = zstd.train_dictionary(_DICT_SIZE, samples)
+            dict_bytes = trained.as_bytes()
+            digest = hashlib.blake2b(dict_bytes, digest_size=4).hexdigest()
+            dict_path = self.archive_path / f"logs-{digest}{_DICT_SUFFIX}"
+            dict_path.write_bytes(dict_bytes)
+            self.logger.info(f"압축 사전 학습 완료: {dict_path} ({len(samples)}개 샘플)")
+            return trained
+        except (OSError, zstd.ZstdError) as e:
+            self.logger.warning(f"압축 사전 학습 실패: {e}")
+            return None
+
+    def _get_zstd_compressor(self, level: int) -> "zstd.ZstdCompressor":
+        """
+        레벨별 ZstdCompressor 재사용
+
+        압축기 생성은 사전 로드와 내부 컨텍스트 초기화 비용이 있으므로
+        같은 레벨로 여러 파일을 압축할 때는 인스턴스를 재사용합니다.
+        threads=-1로 zstd 내부 멀티스레딩을 활성화해 큰 파일도 코어를 활용합니다.
+        """
+        if self._zstd_cctx is not None and self._zstd_cctx_level == level:
+            return self._zstd_cctx
+
+        if not self._zstd_dict_loaded:
+            self._zstd_dict = self._get_or_train_dict()
+            self._zstd_dict_loaded = True
+
+        if self._zstd_dict is not None:
+            cctx = zstd.ZstdCompressor(level=level, dict_data=self._zstd_dict, threads=-1)
+        else:
+            cctx = zstd.ZstdCompressor(level=level, threads=-1)
+
+        self._zstd_cctx = cctx
+        self._zstd_cctx_level = level
+        return cctx
+
+    def _compress_zstd(self, log_file: Path, level: int = 15) -> Optional[Path]:
+        """Zstandard 압축 (학습된 사전 사용, 압축기 재사용)"""
+        if zstd is None:
+            self.logger.error("zstandard 패키지가 설치되지 않았습니다. zip 형식으로 대체합니다.")
+            return self._compress_zip(log_file)
+
+        try:
+            archive_file = self.archive_path / f"{log_file.name}.zst"
+            cctx = self._get_zstd_compressor(level)
+
+            with open(log_file, 'rb') as f_in:
+                with open(archive_file, 'wb') as f_out:
+                    cctx.copy_stream(f_in, f_out, read_size=1 << 20, write_size=1 << 20)
+
+            self.logger.info(f"Zstd 압축 완료: {log_file.name} -> {archive_file.name}")
+            return archive_file
+        except IOError as e:
+            self.logger.error(f"Zstd 압축 실패 (I/O 오류, {log_file}): {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Zstd 압축 실패 ({log_file}): {e}")
+            return None
+
+    def create_daily_archive(self, date_str: Optional[str] = None,
+                             compresslevel: int = 6) -> Optional[Path]:
         """
         날짜별 종합 아카이브 생성
 
+        멤버별 deflate를 스레드 풀에서 병렬로 수행한 뒤(zlib은 GIL을 해제)
+        이미 압축된 바이트를 순서대로 ZIP에 기록합니다.
+
         Args:
             date_str: 아카이브 날짜 (기본값: 어제, 형식: 'YYYY-MM-DD')
+            compresslevel: zlib 압축 레벨 (기본값: 6)
 
         Returns:
             생성된 아카이브 파일 경로
@@ -122,34 +407,37 @@ class LogArchiver:
 
         archive_name = f"logs_archive_{date_str}.zip"
         archive_path = self.archive_path / archive_name
+        self._version += 1  # 파일이 변하므로 조회 캐시 무효화
+
+        # 멤버 목록 수집 (로그 + 이미 압축된 파일)
+        members = []
+        try:
+            if self._log_dir_ok:
+                for entry, st in self._scan(self.log_path, ".log"):
+                    members.append((entry.path, entry.name, st.st_mtime, compresslevel))
+            for entry, st in self._scan(self.archive_path, ".gz"):
+                if entry.name != archive_name:
+                    members.append((entry.path, entry.name, st.st_mtime, compresslevel))
+        except Exception as e:
+            self.logger.warning(f"아카이브 대상 스캔 실패: {e}")
 
         try:
             with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
                 files_added = 0
 
-                # 로그 파일 추가
-                if self.log_path.exists():
-                    try:
-                        for log_file in self.log_path.glob("*.log"):
+                if members:
+                    max_workers = min(os.cpu_count() or 1, 8)
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        for task, result in zip(members, executor.map(_deflate_member, members)):
+                            if result is None:
+                                self.logger.warning(f"아카이브 멤버 압축 실패: {task[1]}")
+                                continue
+                            zinfo, payload = result
                             try:
-                                zf.write(log_file, arcname=log_file.name)
+                                self._write_precompressed(zf, zinfo, payload)
                                 files_added += 1
                             except Exception as e:
-                                self.logger.warning(f"로그 파일 추가 실패 ({log_file.name}): {e}")
-                    except Exception as e:
-                        self.logger.warning(f"로그 파일 스캔 실패: {e}")
-
-                # 이미 압축된 파일 추가
-                try:
-                    for archive_file in self.archive_path.glob("*.gz"):
-                        if archive_file.name != archive_name:
-                            try:
-                                zf.write(archive_file, arcname=archive_file.name)
-                                files_added += 1
-                            except Exception as e:
-                                self.logger.warning(f"압축 파일 추가 실패 ({archive_file.name}): {e}")
-                except Exception as e:
-                    self.logger.warning(f"압축 파일 스캔 실패: {e}")
+                                self.logger.warning(f"아카이브 멤버 기록 실패 ({zinfo.filename}): {e}")
 
             if files_added == 0:
                 self.logger.warning(f"아카이브에 추가된 파일이 없습니다: {archive_name}")
@@ -167,6 +455,31 @@ class LogArchiver:
             self.logger.error(f"아카이브 생성 실패: {e}")
             return None
 
+    @staticmethod
+    def _write_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload) -> None:
+        """
+        이미 deflate된(또는 무압축 저장할) 데이터를 ZIP 멤버로 직접 기록
+
+        zf.open(..., 'w')은 데이터를 다시 압축/재-CRC하므로, 워커에서 만들어 둔
+        압축 바이트를 로컬 헤더와 함께 그대로 기록하고 중앙 디렉토리
+        목록(filelist/NameToInfo)을 손으로 갱신합니다. 로그 파일은 4GB를
+        넘지 않으므로 zip64 헤더는 필요 없습니다.
+
+        Args:
+            payload: deflate된 bytes, 또는 ZIP_STORED 멤버의 원본 파일 경로(str)
+                — 경로인 경우 파일을 1MiB 단위로 직접 스트리밍합니다.
+        """
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(False))
+        if isinstance(payload, str):
+            with open(payload, 'rb') as src:
+                shutil.copyfileobj(src, zf.fp, length=1 << 20)
+        else:
+            zf.fp.write(payload)
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
     def cleanup_old_archives(self, keep_days: int = 30) -> int:
         """
         오래된 아카이브 파일 정리
@@ -177,23 +490,60 @@ class LogArchiver:
         Returns:
             삭제된 파일 개수
         """
-        cutoff_date = datetime.now() - timedelta(days=keep_days)
-        deleted_count = 0
+        if not self._archive_dir_ok:
+            return 0
+
+        self._version += 1  # 파일이 변하므로 조회 캐시 무효화
+
+        # 정수 ns 컷오프 한 번 계산 + 스캔의 캐시된 stat 재사용
+        cutoff_ns = time.time_ns() - keep_days * 86_400 * 1_000_000_000
+        victims = []
+        for entry, st in self._scan(self.archive_path):
+            # 압축 사전은 보관 중인 .zst 아카이브 복원에 필요하므로 삭제 제외
+            if entry.name.endswith(_DICT_SUFFIX):
+                continue
+            if st.st_mtime_ns < cutoff_ns:
+                victims.append(entry.path)
 
-        if not self.archive_path.exists():
+        if not victims:
             return 0
 
-        for archive_file in self.archive_path.glob("*"):
-            if archive_file.is_file() and archive_file.stat().st_mtime < cutoff_date.timestamp():
-                try:
-                    archive_file.unlink()
-                    deleted_count += 1
-                    self.logger.info(f"오래된 아카이브 삭제: {archive_file.name}")
-                except Exception as e:
-                    self.logger.error(f"아카이브 삭제 실패 ({archive_file}): {e}")
+        if len(victims) >= _UNLINK_BATCH_THRESHOLD:
+            return self._unlink_batch(victims)
+
+        deleted_count = 0
+        for archive_file in victims:
+            try:
+                os.unlink(archive_file)
+                deleted_count += 1
+                self.logger.info(f"오래된 아카이브 삭제: {os.path.basename(archive_file)}")
+            except OSError as e:
+                self.logger.error(f"아카이브 삭제 실패 ({archive_file}): {e}")
 
         return deleted_count
 
+    def _unlink_batch(self, victims: List[str]) -> int:
+        """
+        대량 삭제를 스레드 풀로 배치 처리
+
+        unlink는 파일시스템 지연에 묶이는 I/O 작업이라 (GIL 해제)
+        스레드로 겹쳐 실행하면 대규모 정리 시간이 크게 줄어듭니다.
+        """
+        def _unlink_one(path: str) -> bool:
+            try:
+                os.unlink(path)
+                return True
+            except OSError as e:
+                self.logger.error(f"아카이브 삭제 실패 ({path}): {e}")
+                return False
+
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            deleted_count = sum(executor.map(_unlink_one, victims))
+
+        self.logger.info(f"오래된 아카이브 배치 삭제: {deleted_count}/{len(victims)}개")
+        return deleted_count
+
     def get_archive_stats(self) -> Dict[str, object]:
         """
         아카이브 통계 조회
@@ -208,6 +558,13 @@ class LogArchiver:
                 'newest_log': 가장 최신 로그 파일 생성 날짜
             }
         """
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None:
+            version, ts, cached_stats = cached
+            if version == self._version and now - ts < _QUERY_CACHE_TTL_S:
+                return cached_stats
+
         stats = {
             'log_count': 0,
             'log_size_mb': 0,
@@ -217,53 +574,45 @@ class LogArchiver:
             'newest_log': None
         }
 
+        # 루프 본문은 캐시된 stat에서 정수를 누적할 뿐이고 entry별 OSError는
+        # _scan이 이미 처리하므로, 핫 루프 안에 예외 프레임을 두지 않습니다.
         try:
-            if self.log_path.exists():
-                try:
-                    log_files = list(self.log_path.glob("*.log"))
-                    stats['log_count'] = len(log_files)
-
-                    total_size = 0
-                    mtimes = []
-
-                    for log_file in log_files:
-                        try:
-                            size = log_file.stat().st_size
-                            total_size += size
-                            mtimes.append(log_file.stat().st_mtime)
-                        except OSError as e:
-                            self.logger.warning(f"로그 파일 stat 실패 ({log_file.name}): {e}")
-
-                    stats['log_size_mb'] = total_size / (1024 * 1024)
-
-                    if mtimes:
-                        stats['oldest_log'] = datetime.fromtimestamp(min(mtimes)).isoformat()
-                        stats['newest_log'] = datetime.fromtimestamp(max(mtimes)).isoformat()
-
-                except Exception as e:
-                    self.logger.warning(f"로그 파일 통계 조회 실패: {e}")
-
-            if self.archive_path.exists():
-                try:
-                    archive_files = list(self.archive_path.glob("*"))
-                    stats['archive_count'] = len(archive_files)
-
-                    total_size = 0
-                    for archive_file in archive_files:
-                        try:
-                            if archive_file.is_file():
-                                total_size += archive_file.stat().st_size
-                        except OSError as e:
-                            self.logger.warning(f"아카이브 파일 stat 실패 ({archive_file.name}): {e}")
-
-                    stats['archive_size_mb'] = total_size / (1024 * 1024)
-
-                except Exception as e:
-                    self.logger.warning(f"아카이브 파일 통계 조회 실패: {e}")
-
-        except Exception as e:
+            if self._log_dir_ok:
+                # 스캔 한 패스에서 캐시된 stat으로 크기/수정시각을 모두 읽음
+                total_size = 0
+                mtimes = []
+                log_count = 0
+
+                for entry, st in self._scan(self.log_path, ".log"):
+                    log_count += 1
+                    total_size += st.st_size
+                    mtimes.append(st.st_mtime)
+
+                stats['log_count'] = log_count
+                stats['log_size_mb'] = total_size / (1024 * 1024)
+
+                if mtimes:
+                    stats['oldest_log'] = datetime.fromtimestamp(min(mtimes)).isoformat()
+                    stats['newest_log'] = datetime.fromtimestamp(max(mtimes)).isoformat()
+
+            if self._archive_dir_ok:
+                total_size = 0
+                archive_count = 0
+
+                for entry, st in self._scan(self.archive_path):
+                    # 압축 사전 파일은 아카이브가 아니므로 집계 제외
+                    if entry.name.endswith(_DICT_SUFFIX):
+                        continue
+                    archive_count += 1
+                    total_size += st.st_size
+
+                stats['archive_count'] = archive_count
+                stats['archive_size_mb'] = total_size / (1024 * 1024)
+
+        except OSError as e:
             self.logger.error(f"통계 조회 중 오류: {e}")
 
+        self._stats_cache = (self._version, now, stats)
         return stats
 
     def list_archives(self) -> List[Dict[str, object]]:
@@ -273,42 +622,135 @@ class LogArchiver:
         Returns:
             아카이브 파일 정보 리스트
         """
+        now = time.monotonic()
+        cached = self._list_cache
+        if cached is not None:
+            version, ts, cached_list = cached
+            if version == self._version and now - ts < _QUERY_CACHE_TTL_S:
+                return cached_list
+
         archives = []
 
-        if not self.archive_path.exists():
+        if not self._archive_dir_ok:
             return archives
 
         try:
-            archive_files = []
-            for archive_file in self.archive_path.glob("*"):
-                if archive_file.is_file():
-                    try:
-                        mtime = archive_file.stat().st_mtime
-                        archive_files.append((archive_file, mtime))
-                    except OSError as e:
-                        self.logger.warning(f"아카이브 파일 stat 실패 ({archive_file.name}): {e}")
+            # 첫 스캔에서 이름/크기/mtime을 모두 확보해 재-stat을 피함
+            # (압축 사전 파일은 아카이브가 아니므로 목록에서 제외)
+            archive_files = [
+                (entry.name, entry.path, st.st_size, st.st_mtime)
+                for entry, st in self._scan(self.archive_path)
+                if not entry.name.endswith(_DICT_SUFFIX)
+            ]
 
             # mtime 기준 정렬 (최신 파일 먼저)
-            archive_files.sort(key=lambda x: x[1], reverse=True)
+            archive_files.sort(key=lambda x: x[3], reverse=True)
 
-            for archive_file, mtime in archive_files:
-                try:
-                    size = archive_file.stat().st_size
-                    archives.append({
-                        'name': archive_file.name,
-                        'size_mb': size / (1024 * 1024),
-                        'created': datetime.fromtimestamp(mtime).isoformat(),
-                        'path': str(archive_file)
-                    })
-                except OSError as e:
-                    self.logger.warning(f"아카이브 파일 정보 조회 실패 ({archive_file.name}): {e}")
+            for name, path, size, mtime in archive_files:
+                archives.append({
+                    'name': name,
+                    'size_mb': size / (1024 * 1024),
+                    'created': datetime.fromtimestamp(mtime).isoformat(),
+                    'path': path
+                })
 
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"아카이브 목록 조회 중 오류: {e}")
 
+        self._list_cache = (self._version, now, archives)
         return archives
 
 
+def _compress_one(task: Tuple[str, str, str, str, Optional[bytes], int, int]) -> Optional[Tuple[str, int]]:
+    """
+    워커 프로세스에서 로그 파일 하나를 압축 (ProcessPoolExecutor용)
+
+    Args:
+        task: (로그 파일 경로, 로그 디렉토리, 아카이브 디렉토리, 압축 형식,
+               zstd 사전 바이트, zlib 압축 레벨, zstd 압축 레벨)
+
+    Returns:
+        (압축 파일 이름, 크기) 튜플 (실패 시 None)
+    """
+    log_path_str, log_dir, archive_dir, archive_type, dict_bytes, compresslevel, zstd_level = task
+
+    archiver = LogArchiver(log_dir=log_dir, archive_dir=archive_dir)
+    if dict_bytes is not None and zstd is not None:
+        archiver._zstd_dict = zstd.ZstdCompressionDict(dict_bytes)
+        archiver._zstd_dict_loaded = True
+
+    log_file = Path(log_path_str)
+    if archive_type == "gz":
+        compressed_path = archiver._compress_gzip(log_file, compresslevel=compresslevel)
+    elif archive_type == "zst":
+        compressed_path = archiver._compress_zstd(log_file, level=zstd_level)
+    else:
+        compressed_path = archiver._compress_zip(log_file, compresslevel=compresslevel)
+
+    if not compressed_path:
+        return None
+
+    try:
+        return compressed_path.name, compressed_path.stat().st_size
+    except OSError:
+        return None
+
+
+def _deflate_member(task: Tuple[str, str, float, int]) -> Optional[Tuple[zipfile.ZipInfo, bytes]]:
+    """
+    워커 스레드에서 ZIP 멤버 하나를 deflate (ThreadPoolExecutor용)
+
+    zlib 압축/CRC 계산 중에는 GIL이 해제되므로 스레드만으로도
+    멤버 간 압축이 실제로 병렬화됩니다.
+
+    Args:
+        task: (파일 경로, 아카이브 내 이름, 수정 시각, zlib 압축 레벨)
+
+    Returns:
+        (완성된 ZipInfo, 압축 바이트) 튜플 (실패 시 None)
+    """
+    path, arcname, mtime, compresslevel = task
+
+    zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(mtime)[:6])
+    zinfo.external_attr = 0o600 << 16
+
+    if arcname.endswith((".gz", ".zip", ".zst")):
+        # 이미 압축된 멤버는 재-deflate 해봐야 CPU만 쓰고 오히려 커짐 -> 무압축 저장.
+        # mmap 전체에 crc32를 한 번만 호출해 청크 루프/유저 공간 복사 없이
+        # zlib의 SIMD CRC 경로로 바로 들어가고, 바이트는 기록 시점에 스트리밍.
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        crc = zlib.crc32(mm)
+                else:
+                    crc = 0
+        except (OSError, ValueError):
+            return None
+
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.file_size = size
+        zinfo.compress_size = size
+        zinfo.CRC = crc
+        return zinfo, path
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    comp = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    comp_bytes = comp.compress(data) + comp.flush()
+
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(comp_bytes)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, comp_bytes
+
+
 def setup_archiver(log_dir: str = "logs", archive_dir: Optional[str] = None) -> LogArchiver:
     """
     로그 아카이버 설정
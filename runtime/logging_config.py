@@ -3,26 +3,79 @@
 
 구조화된 JSON 로깅과 파일 로테이션, 자동 아카이빙을 제공합니다.
 """
+from __future__ import annotations
+
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import atexit
 import json
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from runtime.log_archiver import LogArchiver
 
+# MemoryHandler 배치 설정: 일반 레코드는 모아서 쓰고, 지연 상한은 타이머로 보장
+_FLUSH_CAPACITY = 1024
+_FLUSH_INTERVAL_S = 1.0
+
+# 포맷터가 레코드마다 참조하는 상수 (호출 시 재생성/재파싱 방지)
+_JSON_TS_FMT = "%Y-%m-%dT%H:%M:%S"
+_CONSOLE_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 레코드마다 모듈 조회를 거치지 않도록 직렬화 함수를 한 번만 바인딩
+if orjson is not None:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+class PassthroughQueueHandler(QueueHandler):
+    """레코드를 변형하지 않고 그대로 큐에 넣는 QueueHandler
+
+    기본 prepare()는 레코드를 미리 포맷하면서 exc_info를 제거해
+    JSONFormatter의 "exception" 필드가 파일 로그에서 사라집니다.
+    큐가 같은 프로세스 안에 있으므로 exc_info를 그대로 전달해도 안전합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 class JSONFormatter(logging.Formatter):
     """JSON 형식 로그 포맷터"""
     
     def format(self, record: logging.LogRecord) -> str:
+        # datetime 객체를 새로 만들지 않고 레코드에 이미 있는 created를 사용
+        created = record.created
+        timestamp = (f"{time.strftime(_JSON_TS_FMT, time.gmtime(created))}"
+                     f".{int((created % 1) * 1e6):06d}Z")
+
+        # 인자가 없으면 %-포매팅을 건너뜀 (레코드 대부분이 이 경우)
+        message = record.msg if isinstance(record.msg, str) else str(record.msg)
+        if record.args:
+            message = message % record.args
+
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -44,12 +97,12 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps(log_data)
 
 
 class ConsoleFormatter(logging.Formatter):
     """콘솔용 읽기 쉬운 포맷터"""
-    
+
     COLORS = {
         "DEBUG": "\033[36m",      # Cyan
         "INFO": "\033[32m",       # Green
@@ -58,11 +111,16 @@ class ConsoleFormatter(logging.Formatter):
         "CRITICAL": "\033[35m",   # Magenta
     }
     RESET = "\033[0m"
-    
+
+    # 레벨별 색 입힌 문자열을 미리 만들어 호출마다 f-string을 만들지 않음
+    # (컴프리헨션은 클래스 스코프를 보지 못하므로 RESET은 리터럴로 기입)
+    COLORED_LEVELNAMES = {
+        level: f"{color}{level}\033[0m" for level, color in COLORS.items()
+    }
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        
+        record.levelname = self.COLORED_LEVELNAMES.get(record.levelname, record.levelname)
+
         # 요청 ID 추가
         request_id = getattr(record, "request_id", "")
         if request_id:
@@ -107,7 +165,7 @@ def setup_logging(
     console_handler.setLevel(logging.INFO)
     console_formatter = ConsoleFormatter(
         "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+        datefmt=_CONSOLE_TS_FMT
     )
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
@@ -122,7 +180,6 @@ def setup_logging(
     )
     file_handler.setLevel(logging.DEBUG)  # 파일에는 모든 레벨 저장
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
 
     # 에러 전용 파일 핸들러
     error_file = log_path / "error.log"
@@ -134,7 +191,28 @@ def setup_logging(
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(JSONFormatter())
-    logger.addHandler(error_handler)
+
+    # 작은 JSON 레코드를 모아 큰 단위로 기록 (ERROR 이상은 즉시 플러시,
+    # 평상시 지연 상한은 아래 타이머가 보장). 에러 전용 핸들러는 비버퍼링.
+    memory_handler = MemoryHandler(
+        capacity=_FLUSH_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+    # 파일 I/O(쓰기 + 로테이션)를 리스너 스레드로 분리:
+    # 요청 스레드의 로깅 비용은 큐 enqueue 한 번으로 줄어듭니다.
+    _stop_queue_listener()
+    global _queue_listener, _memory_handler
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    logger.addHandler(PassthroughQueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, memory_handler, error_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    _memory_handler = memory_handler
+    _schedule_flush()
 
     # 아카이버 설정 (전역 변수에 저장)
     if enable_archiver:
@@ -149,6 +227,51 @@ def setup_logging(
 # 전역 아카이버 인스턴스
 _archiver: Optional[LogArchiver] = None
 
+# 파일 핸들러를 소유한 큐 리스너 (setup_logging에서 생성)
+_queue_listener: Optional[QueueListener] = None
+
+# 배치 기록용 MemoryHandler와 주기 플러시 타이머
+_memory_handler: Optional[MemoryHandler] = None
+_flush_timer: Optional[threading.Timer] = None
+
+
+def _schedule_flush() -> None:
+    """MemoryHandler를 주기적으로 플러시해 버퍼링 지연의 상한을 보장"""
+    global _flush_timer
+    if _memory_handler is None:
+        return
+    try:
+        _memory_handler.flush()
+    except Exception:
+        pass
+    _flush_timer = threading.Timer(_FLUSH_INTERVAL_S, _schedule_flush)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _stop_queue_listener() -> None:
+    """큐 리스너/플러시 타이머 정지 (재설정/종료 시 남은 레코드를 파일로 비움)"""
+    global _queue_listener, _memory_handler, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _memory_handler is not None:
+        try:
+            _memory_handler.flush()
+        except Exception:
+            pass
+        _memory_handler = None
+    if _queue_listener is None:
+        return
+    try:
+        _queue_listener.stop()
+    except Exception:
+        pass
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -163,13 +286,16 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def archive_logs(older_than_days: int = 7, archive_type: str = "zip") -> dict:
+def archive_logs(older_than_days: int = 7, archive_type: str = "zip",
+                 compresslevel: int = 6, archive_tier: str = "balanced") -> Dict[str, int]:
     """
     오래된 로그 파일을 아카이브
 
     Args:
         older_than_days: 이 날짜보다 오래된 파일을 압축
-        archive_type: 압축 형식 ('zip' 또는 'gz')
+        archive_type: 압축 형식 ('zip', 'gz' 또는 'zst')
+        compresslevel: zlib 압축 레벨 1~9 (zip/gz에만 적용, 기본값: 6)
+        archive_tier: zst 티어 ('realtime'/'balanced'/'archival', 기본값: 'balanced')
 
     Returns:
         압축 결과 딕셔너리
@@ -179,7 +305,8 @@ def archive_logs(older_than_days: int = 7, archive_type: str = "zip") -> dict:
         logger.warning("아카이버가 초기화되지 않았습니다. setup_logging에서 enable_archiver=True를 설정하세요.")
         return {}
 
-    return _archiver.compress_logs(older_than_days=older_than_days, archive_type=archive_type)
+    return _archiver.compress_logs(older_than_days=older_than_days, archive_type=archive_type,
+                                   compresslevel=compresslevel, archive_tier=archive_tier)
 
 
 def create_daily_archive(date_str: Optional[str] = None) -> Optional[str]:
@@ -219,7 +346,7 @@ def cleanup_old_archives(keep_days: int = 30) -> int:
     return _archiver.cleanup_old_archives(keep_days=keep_days)
 
 
-def get_archive_stats() -> dict:
+def get_archive_stats() -> Dict[str, Any]:
     """
     아카이브 통계 조회
 
@@ -234,7 +361,7 @@ def get_archive_stats() -> dict:
     return _archiver.get_archive_stats()
 
 
-def list_archives() -> list:
+def list_archives() -> List[Dict[str, Any]]:
     """
     아카이브 파일 목록 조회
 
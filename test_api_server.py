@@ -2,7 +2,6 @@
 FastAPI 서버 테스트 스크립트
 """
 import requests
-import base64
 from pathlib import Path
 
 # 서버 URL
@@ -49,41 +48,37 @@ def test_tts_file_upload():
         print(f"Error: {response.text}")
         return False
 
-def test_tts_json():
-    """JSON 방식 TTS 테스트"""
-    print("\n=== TTS JSON 테스트 ===")
-    
+def test_tts_streamed():
+    """스트리밍 방식 TTS 테스트 (Base64 왕복 없이 측정)"""
+    print("\n=== TTS 스트리밍 테스트 ===")
+
     reference_audio_path = Path("assets/SPK066KBSCU021F003.wav")
-    
+
     if not reference_audio_path.exists():
         print(f"참조 오디오 파일이 없습니다: {reference_audio_path}")
         return False
-    
-    # Base64 인코딩
-    with open(reference_audio_path, "rb") as f:
-        audio_base64 = base64.b64encode(f.read()).decode('utf-8')
-    
+
     data = {
-        "text": "JSON 방식 테스트입니다.",
-        "reference_text": "브란덴부르크 주에서도 서식하며 개체수를 늘려가고 있습니다",
-        "reference_audio_base64": audio_base64
+        "text": "스트리밍 방식 테스트입니다.",
+        "reference_text": "브란덴부르크 주에서도 서식하며 개체수를 늘려가고 있습니다"
     }
-    
-    response = requests.post(f"{API_URL}/tts/json", json=data)
-    
+
+    # 참조 오디오를 멀티파트로 스트리밍 업로드하고 응답도 청크 단위로 받음
+    # (Base64 인코딩/디코딩의 2배 메모리 사용과 ~33% 전송 오버헤드 제거)
+    with open(reference_audio_path, "rb") as f:
+        files = {"reference_audio": ("ref.wav", f, "audio/wav")}
+        response = requests.post(f"{API_URL}/tts", files=files, data=data, stream=True)
+
     print(f"Status: {response.status_code}")
     if response.status_code == 200:
-        result = response.json()
-        print(f"Sample Rate: {result['sample_rate']}")
-        print(f"Duration: {result['duration_seconds']:.2f}s")
-        print(f"Request ID: {result['request_id']}")
-        
-        # Base64 디코딩 후 저장
-        audio_bytes = base64.b64decode(result['audio_base64'])
-        output_path = Path("test_output_api_json.wav")
+        output_path = Path("test_output_api_stream.wav")
+        total_bytes = 0
         with open(output_path, "wb") as f:
-            f.write(audio_bytes)
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+                total_bytes += len(chunk)
         print(f"오디오 저장 완료: {output_path}")
+        print(f"파일 크기: {total_bytes} bytes")
         return True
     else:
         print(f"Error: {response.text}")
@@ -101,7 +96,7 @@ def main():
     
     # TTS 테스트
     results.append(("TTS File Upload", test_tts_file_upload()))
-    results.append(("TTS JSON", test_tts_json()))
+    results.append(("TTS Streamed", test_tts_streamed()))
     
     # 결과 요약
     print("\n" + "="*50)
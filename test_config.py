@@ -52,7 +52,10 @@ def test_env_override():
     # 환경 변수 설정
     os.environ['ZIPVOICE_API_PORT'] = '9000'
     os.environ['ZIPVOICE_LOGGING_LEVEL'] = 'DEBUG'
-    
+
+    # load_config는 캐시되므로 환경 변수 반영을 위해 캐시 초기화
+    load_config.cache_clear()
+
     try:
         config = load_config()
         api_config = get_api_config(config)
@@ -68,7 +71,8 @@ def test_env_override():
         # 환경 변수 정리
         del os.environ['ZIPVOICE_API_PORT']
         del os.environ['ZIPVOICE_LOGGING_LEVEL']
-        
+        load_config.cache_clear()
+
         return True
         
     except Exception as e:
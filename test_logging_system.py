@@ -76,12 +76,16 @@ def test_logging_to_file():
 
     test_logger = get_logger("test_module")
 
-    # 여러 로그 기록
-    for i in range(10):
-        test_logger.info(f"테스트 로그 #{i+1}")
-        time.sleep(0.1)
+    # 배치 경로(QueueHandler + MemoryHandler)가 실제로 발동하는 규모로 기록
+    # (콘솔 핸들러는 INFO 레벨이라 DEBUG 레코드는 파일에만 남음)
+    record_count = 10_000
+    for i in range(record_count):
+        test_logger.debug("테스트 로그 #%d", i + 1)
 
-    print("[OK] 10개의 로그 메시지 생성 완료\n")
+    # 주기 플러시(1초)가 버퍼에 남은 레코드를 파일로 내릴 때까지 대기
+    time.sleep(1.2)
+
+    print(f"[OK] {record_count}개의 로그 메시지 생성 완료\n")
 
     # 로그 파일 확인
     log_file = Path("logs/api_server.json.log")
@@ -1,58 +1,79 @@
 """
 추론 코드의 import를 검증하는 스크립트
 """
+import os
 import sys
 import importlib.util
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 def check_imports(file_path):
     """파일의 import가 정상인지 확인"""
+    basename = os.path.basename(file_path)
     try:
-        spec = importlib.util.spec_from_file_location("module", file_path)
+        # 파일마다 고유한 이름을 써서 프로세스 내 sys.modules 충돌 방지
+        module_name = f"_verify_{os.path.splitext(basename)[0]}"
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None:
             return False, f"Failed to load spec for {file_path}"
-        
+
         module = importlib.util.module_from_spec(spec)
-        sys.modules["module"] = module
-        spec.loader.exec_module(module)
-        return True, f"✓ {file_path.name}"
+
+        # 실행 중 전이적으로 import된 모듈까지 되돌려, 같은 프로세스에서
+        # 여러 파일을 검사해도 각 검사가 진짜 콜드 import로 남게 함
+        # (앞 파일이 의존성을 미리 깔아줘서 다음 파일이 통과하는 것을 방지)
+        before = set(sys.modules)
+        try:
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        finally:
+            for key in set(sys.modules) - before:
+                sys.modules.pop(key, None)
+        return True, f"✓ {basename}"
     except Exception as e:
-        return False, f"✗ {file_path.name}: {str(e)}"
+        return False, f"✗ {basename}: {str(e)}"
 
 def main():
-    base_dir = Path("D:/12-02")
-    
-    # 검증할 추론 파일들
+    base = "D:/12-02"
+
+    # 검증할 추론 파일들 (경로 연산은 문자열 join 한 번으로 끝냄)
     inference_files = [
         # 모델 정의
-        base_dir / "zipvoice/models/zipvoice_dialog.py",
-        base_dir / "zipvoice/models/zipvoice.py",
-        base_dir / "zipvoice/models/zipvoice_distill.py",
-        
+        "zipvoice/models/zipvoice_dialog.py",
+        "zipvoice/models/zipvoice.py",
+        "zipvoice/models/zipvoice_distill.py",
+
         # 토크나이저
-        base_dir / "zipvoice/tokenizer/tokenizer.py",
-        
+        "zipvoice/tokenizer/tokenizer.py",
+
         # 유틸리티
-        base_dir / "zipvoice/utils/checkpoint.py",
-        base_dir / "zipvoice/utils/feature.py",
-        base_dir / "zipvoice/utils/infer.py",
-        
+        "zipvoice/utils/checkpoint.py",
+        "zipvoice/utils/feature.py",
+        "zipvoice/utils/infer.py",
+
         # 추론 스크립트
-        base_dir / "zipvoice/bin/infer_zipvoice_dialog.py",
-        base_dir / "zipvoice/bin/infer_zipvoice.py",
-        
+        "zipvoice/bin/infer_zipvoice_dialog.py",
+        "zipvoice/bin/infer_zipvoice.py",
+
         # 서빙
-        base_dir / "runtime/nvidia_triton/pytriton_server.py",
+        "runtime/nvidia_triton/pytriton_server.py",
     ]
-    
+    files = [os.path.join(base, name) for name in inference_files]
+
+    # 각 파일을 별도 프로세스에서 검사: torch 등 무거운 import가 파일 간에
+    # 겹쳐 실행되고(코어 수만큼 병렬), sys.modules 오염도 프로세스에 격리됨
+    existing = [p for p in files if os.path.exists(p)]
+    checked = {}
+    if existing:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_path, result in zip(existing, executor.map(check_imports, existing)):
+                checked[file_path] = result
+
     results = []
-    for file_path in inference_files:
-        if not file_path.exists():
-            results.append((False, f"✗ {file_path.name}: 파일이 존재하지 않습니다"))
-            continue
-        
-        success, message = check_imports(file_path)
-        results.append((success, message))
+    for file_path in files:
+        if file_path in checked:
+            results.append(checked[file_path])
+        else:
+            results.append((False, f"✗ {os.path.basename(file_path)}: 파일이 존재하지 않습니다"))
     
     # 결과 출력
     print("\n=== 추론 코드 Import 검증 결과 ===\n")
@@ -1,11 +1,13 @@
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-import tritonclient.http as httpclient
-from scipy.io.wavfile import write
+import soundfile as sf
+import tritonclient.grpc as grpcclient
 
-def verify_health(url):
+def verify_health(client):
     try:
-        client = httpclient.InferenceServerClient(url=url)
         if client.is_server_live():
             print("Server is live.")
         else:
@@ -29,56 +31,98 @@ def verify_health(url):
         print(f"Health check failed: {e}")
         return False
 
-def verify_inference(url, text, output_file):
+def get_output_names(client):
+    """모델 메타데이터에서 출력 텐서 이름을 한 번만 조회 (실패 시 기본값)"""
     try:
-        client = httpclient.InferenceServerClient(url=url)
-        
-        inputs = []
-        inputs.append(httpclient.InferInput("target_text", [1], "BYTES"))
-        inputs.append(httpclient.InferInput("reference_text", [1], "BYTES"))
-        
-        # Dummy reference text/audio for now as we are not using speaker cache in this simple test
-        # or we can use the defaults if the model handles it.
-        # Based on pytriton_server.py logic:
-        # inputs=[
-        #     Tensor(name="reference_text", dtype=np.object_, shape=(1,)),
-        #     Tensor(name="target_text", dtype=np.object_, shape=(1,)),
-        #     Tensor(name="reference_wav", dtype=np.float32, shape=(-1,), optional=True),
-        #     Tensor(name="reference_wav_len", dtype=np.int32, shape=(1,), optional=True),
-        # ],
-        
-        inputs[0].set_data_from_numpy(np.array([text.encode("utf-8")], dtype=np.object_))
-        inputs[1].set_data_from_numpy(np.array(["dummy reference".encode("utf-8")], dtype=np.object_))
-        
-        outputs = []
-        outputs.append(httpclient.InferRequestedOutput("waveform"))
-        
-        print(f"Sending inference request for text: '{text}'")
-        response = client.infer("zipvoice_dialog", inputs, outputs=outputs)
-        
-        waveform = response.as_numpy("waveform")
+        metadata = client.get_model_metadata("zipvoice_dialog", as_json=True)
+        names = [output["name"] for output in metadata["outputs"]]
+        if names:
+            return names
+    except Exception as e:
+        print(f"Model metadata unavailable ({e}); using default outputs.")
+    return ["waveform"]
+
+def verify_inference(url, text, output_file, output_names=("waveform",),
+                     concurrency=1, num_requests=1):
+    try:
+        # 요청마다 리스트를 새로 만들지 않도록 출력 목록은 한 번만 구성
+        # (InferRequestedOutput은 요청 간 상태가 없어 재사용 가능)
+        outputs = [grpcclient.InferRequestedOutput(name) for name in output_names]
+        # A single gRPC channel saturates around one client's throughput,
+        # so each worker thread keeps its own client/channel.
+        local = threading.local()
+
+        def _infer_once():
+            client = getattr(local, "client", None)
+            if client is None:
+                client = grpcclient.InferenceServerClient(url=url)
+                local.client = client
+                # 입력 배열/InferInput은 스레드당 한 번만 만들고 요청마다
+                # 제자리 갱신해 재사용 (요청당 numpy/객체 할당 제거)
+                local.text_buf = np.empty(1, dtype=np.object_)
+                local.ref_buf = np.empty(1, dtype=np.object_)
+                local.inputs = [
+                    grpcclient.InferInput("target_text", [1], "BYTES"),
+                    grpcclient.InferInput("reference_text", [1], "BYTES"),
+                ]
+
+            # Dummy reference text/audio for now as we are not using speaker cache in this simple test
+            # or we can use the defaults if the model handles it.
+            # Based on pytriton_server.py logic:
+            # inputs=[
+            #     Tensor(name="reference_text", dtype=np.object_, shape=(1,)),
+            #     Tensor(name="target_text", dtype=np.object_, shape=(1,)),
+            #     Tensor(name="reference_wav", dtype=np.float32, shape=(-1,), optional=True),
+            #     Tensor(name="reference_wav_len", dtype=np.int32, shape=(1,), optional=True),
+            # ],
+
+            local.text_buf[0] = text.encode("utf-8")
+            local.ref_buf[0] = "dummy reference".encode("utf-8")
+            local.inputs[0].set_data_from_numpy(local.text_buf)
+            local.inputs[1].set_data_from_numpy(local.ref_buf)
+
+            response = client.infer("zipvoice_dialog", local.inputs, outputs=outputs)
+            return response.as_numpy(output_names[0])
+
+        # Overlapping requests let the server-side dynamic batcher fill a
+        # batch instead of running every request at batch=1.
+        print(f"Sending {num_requests} inference request(s) for text: '{text}' "
+              f"(concurrency={concurrency})")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(_infer_once) for _ in range(num_requests)]
+            waveforms = [f.result() for f in futures]
+
+        waveform = waveforms[0]
         print(f"Received waveform shape: {waveform.shape}")
-        
+
         # Save to file
         # Assuming 24kHz as per pytriton_server.py default
-        write(output_file, 24000, waveform.squeeze())
+        sf.write(output_file, waveform.squeeze().astype(np.float32), 24000)
         print(f"Saved audio to {output_file}")
         return True
-        
+
     except Exception as e:
         print(f"Inference failed: {e}")
         return False
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--url", type=str, default="localhost:8000", help="Triton server URL")
+    parser.add_argument("--url", type=str, default="localhost:8001", help="Triton server gRPC URL")
     parser.add_argument("--text", type=str, default="안녕하세요, 테스트입니다.", help="Text to synthesize")
     parser.add_argument("--output", type=str, default="verify_output.wav", help="Output audio file")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of concurrent client threads")
+    parser.add_argument("--requests", type=int, default=1, help="Total number of inference requests to send")
     args = parser.parse_args()
-    
+
+    # gRPC channel is created once and reused for health + inference,
+    # and tensors ride the wire as binary protobuf instead of JSON.
+    client = grpcclient.InferenceServerClient(url=args.url)
+
     print("Verifying Triton Server Health...")
-    if verify_health(args.url):
+    if verify_health(client):
+        output_names = get_output_names(client)
         print("\nVerifying Inference...")
-        verify_inference(args.url, args.text, args.output)
+        verify_inference(args.url, args.text, args.output, output_names=output_names,
+                         concurrency=args.concurrency, num_requests=args.requests)
     else:
         print("\nSkipping inference verification due to health check failure.")
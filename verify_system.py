@@ -3,14 +3,25 @@
 
 추론 코드, API 서버, 의존성 등을 종합적으로 검증합니다.
 """
+import ast
+import compileall
+import os
 import sys
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def cached_import(module_name, item_name):
+    """sys.modules에 있으면 import 기계를 거치지 않고 바로 속성을 꺼냄"""
+    mods = sys.modules
+    mod = mods.get(module_name) or importlib.import_module(module_name)
+    return getattr(mod, item_name)
+
+
 def test_imports():
     """핵심 모듈 import 테스트"""
     print("\n=== 핵심 모듈 Import 테스트 ===")
-    
+
     modules = [
         ("zipvoice.models.zipvoice_dialog", "ZipVoiceDialog"),
         ("zipvoice.tokenizer.tokenizer", "EspeakTokenizer"),
@@ -18,12 +29,12 @@ def test_imports():
         ("zipvoice.utils.feature", "VocosFbank"),
         ("zipvoice.utils.infer", "rms_norm"),
     ]
-    
+
     passed = 0
     for module_name, class_name in modules:
+        # 앞 항목이 전이적으로 import한 모듈은 sys.modules 딕셔너리 조회로 끝남
         try:
-            module = importlib.import_module(module_name)
-            getattr(module, class_name)
+            cached_import(module_name, class_name)
             print(f"✓ {module_name}.{class_name}")
             passed += 1
         except Exception as e:
@@ -59,10 +70,46 @@ def test_api_server_imports():
     return passed == len(modules)
 
 
-def test_file_structure():
+# snapshot()이 재귀해 들어가는 디렉토리 (그 외는 탐색하지 않음)
+_DIRS_OF_INTEREST = {
+    "zipvoice",
+    "zipvoice/bin",
+    "zipvoice/models",
+    "zipvoice/tokenizer",
+    "zipvoice/utils",
+    "runtime",
+    "runtime/nvidia_triton",
+    "espeak",
+    "egs",
+}
+
+
+def snapshot(base):
+    """관심 디렉토리만 scandir로 한 번 훑어 상대 경로 집합을 만듦
+
+    파일마다 exists()로 stat()을 부르는 대신 디렉토리당 한 번의
+    scandir 호출로 항목을 모아, 이후 존재 확인은 set 조회로 끝냅니다.
+    """
+    out = set()
+    stack = [base]
+    while stack:
+        d = stack.pop()
+        try:
+            entries = list(os.scandir(d))
+        except OSError:
+            continue
+        for e in entries:
+            rel = Path(e.path).relative_to(base).as_posix()
+            out.add(rel)
+            if e.is_dir(follow_symlinks=False) and rel in _DIRS_OF_INTEREST:
+                stack.append(e.path)
+    return out
+
+
+def test_file_structure(snap):
     """파일 구조 검증"""
     print("\n=== 파일 구조 검증 ===")
-    
+
     required_files = [
         "zipvoice/models/zipvoice_dialog.py",
         "zipvoice/tokenizer/tokenizer.py",
@@ -76,23 +123,21 @@ def test_file_structure():
         "espeak/model.json",
         "espeak/tokens.txt",
     ]
-    
-    base_dir = Path("D:/12-02")
-    passed = 0
-    
+
+    # 존재 판정은 집합 차연산 한 번으로 끝남 (추가 I/O 없음)
+    missing = set(required_files) - snap
     for file_path in required_files:
-        full_path = base_dir / file_path
-        if full_path.exists():
-            print(f"✓ {file_path}")
-            passed += 1
-        else:
+        if file_path in missing:
             print(f"✗ {file_path}: 파일 없음")
-    
+        else:
+            print(f"✓ {file_path}")
+
+    passed = len(required_files) - len(missing)
     print(f"\n결과: {passed}/{len(required_files)} 파일 존재")
-    return passed == len(required_files)
+    return not missing
 
 
-def test_deleted_training_files():
+def test_deleted_training_files(snap):
     """학습 파일이 제대로 삭제되었는지 확인"""
     print("\n=== 학습 파일 삭제 확인 ===")
     
@@ -104,20 +149,18 @@ def test_deleted_training_files():
         "zipvoice/bin/train_zipvoice_dialog.py",
         "zipvoice/bin/prepare_dataset.py",
     ]
-    
-    base_dir = Path("D:/12-02")
-    passed = 0
-    
+
+    # 스냅샷과의 교집합이 곧 "아직 남아 있는" 파일 목록
+    leftover = set(should_not_exist) & snap
     for file_path in should_not_exist:
-        full_path = base_dir / file_path
-        if not full_path.exists():
-            print(f"✓ {file_path} 삭제됨")
-            passed += 1
-        else:
+        if file_path in leftover:
             print(f"✗ {file_path} 아직 존재함")
-    
+        else:
+            print(f"✓ {file_path} 삭제됨")
+
+    passed = len(should_not_exist) - len(leftover)
     print(f"\n결과: {passed}/{len(should_not_exist)} 파일 정리 완료")
-    return passed == len(should_not_exist)
+    return not leftover
 
 
 def test_api_server_syntax():
@@ -135,8 +178,9 @@ def test_api_server_syntax():
     for file_path in files:
         full_path = base_dir / file_path
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                compile(f.read(), full_path, 'exec')
+            # 문법 검증에는 파서만 필요하므로 바이트코드 생성을 생략
+            # (bytes를 그대로 넘기면 파서가 인코딩 선언대로 직접 디코드)
+            ast.parse(full_path.read_bytes(), filename=str(full_path))
             print(f"✓ {file_path}")
             passed += 1
         except SyntaxError as e:
@@ -153,23 +197,38 @@ def main():
     print("="*60)
     print("ZipVoice 전체 시스템 검증")
     print("="*60)
-    
-    results = []
-    
-    # 1. 파일 구조
-    results.append(("파일 구조", test_file_structure()))
-    
-    # 2. 학습 파일 삭제 확인
-    results.append(("학습 파일 정리", test_deleted_training_files()))
-    
-    # 3. 핵심 모듈 import
-    results.append(("추론 모듈 Import", test_imports()))
-    
-    # 4. API 서버 import
-    results.append(("API 서버 Import", test_api_server_imports()))
-    
-    # 5. API 서버 문법
-    results.append(("API 서버 문법", test_api_server_syntax()))
+
+    # 무거운 의존성을 한 번만 미리 적재: 이후 zipvoice import는 전부
+    # sys.modules 캐시에 적중하고, 실패 시 각 테스트가 원인을 출력함
+    try:
+        import torch, numpy, soundfile  # noqa: F401
+    except ImportError:
+        pass
+
+    # 콜드 런에서 pyc 캐시를 모든 코어로 미리 채워 두면
+    # 이후 문법 검증과 import 단계가 같은 pyc를 재사용함
+    try:
+        compileall.compile_dir(str(Path("D:/12-02") / "runtime"), quiet=1, workers=0)
+    except Exception:
+        pass
+
+    # 파일 존재 확인은 디렉토리 스냅샷 한 번으로 대체 (테스트 둘이 공유)
+    snap = snapshot(Path("D:/12-02"))
+
+    tests = [
+        ("파일 구조", lambda: test_file_structure(snap)),
+        ("학습 파일 정리", lambda: test_deleted_training_files(snap)),
+        ("추론 모듈 Import", test_imports),
+        ("API 서버 Import", test_api_server_imports),
+        ("API 서버 문법", test_api_server_syntax),
+    ]
+
+    # torch 등 무거운 import는 .so 로딩 중 GIL을 놓으므로, 파일/문법 검사를
+    # 스레드로 겹쳐 돌리면 import 대기 시간 아래에 숨습니다. 각 테스트의
+    # 상세 출력은 섞일 수 있지만 아래 요약은 항상 같은 순서로 나옵니다.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(name, executor.submit(fn)) for name, fn in tests]
+        results = [(name, future.result()) for name, future in futures]
     
     # 결과 요약
     print("\n" + "="*60)